@@ -1,30 +1,38 @@
 import psutil
-import cpuinfo
 import platform
 import threading
-import subprocess
+import queue
+import traceback
+import time
 import os
-import requests
+import io
+import re
+import ctypes
+import struct
+import json
+import functools
+import types
+from array import array
 import urllib.parse
-from tkinter import Tk, Label, Button, Menu, messagebox, StringVar, ttk, filedialog, Frame
+from tkinter import Tk, Label, Button, Menu, messagebox, StringVar, ttk, filedialog, Canvas
 from tkinter import N, S, E, W
-from bs4 import BeautifulSoup
 from tkinter import font
 
-try:
-    import wmi
-except Exception:
-    wmi = None
-
 # ---------- Helper functions ----------
 
+@functools.lru_cache(maxsize=None)
+def get_cpu_info():
+    # py-cpuinfo probes CPUID and parses strings on every call; do it once per process.
+    # Imported here so a static-cache hit never loads it at all.
+    import cpuinfo
+    return cpuinfo.get_cpu_info()
+
+# ARM brand strings read "ARMv7 Processor ...", so the architecture version may follow.
+_VENDOR_RE = re.compile(r'\b(Intel|AMD|Apple|ARM|Ampere|Qualcomm|IBM)(?:(?<=ARM)v\d+)?\b')
+
 def get_cpu_brand_name(raw_name: str) -> str:
-    _cpu_name = str(raw_name)
-    if "Intel" in _cpu_name:
-        return "Intel"
-    if "AMD" in _cpu_name:
-        return "AMD"
-    return "Unknown"
+    m = _VENDOR_RE.search(str(raw_name))
+    return m.group(1) if m else "Unknown"
 
 def get_core_numbers():
     physical = psutil.cpu_count(logical=False)
@@ -32,72 +40,260 @@ def get_core_numbers():
     return {"physical_cores": physical, "logical_cores": logical}
 
 def get_cpu_freq():
+    # Only the fixed limits; the live value comes from read_current_mhz().
     f = psutil.cpu_freq()
     if not f:
-        return {"current_mhz": None, "min_mhz": None, "max_mhz": None}
+        return {"min_mhz": None, "max_mhz": None}
     return {
-        "current_mhz": round(f.current, 2),
-        "min_mhz": round(f.min, 2) if f.min else None,
-        "max_mhz": round(f.max, 2) if f.max else None,
-        "current_ghz": round(f.current / 1000.0, 3) if f.current else None,
+        "min_mhz": f.min or None,
+        "max_mhz": f.max or None,
     }
 
-def get_cpu_percentages(sample_interval=0.5):
-    per_core = psutil.cpu_percent(percpu=True, interval=sample_interval)
-    overall = psutil.cpu_percent(interval=None)
-    return per_core, overall
+_CUR_FREQ_PATH = "/sys/devices/system/cpu/cpu0/cpufreq/scaling_cur_freq"
 
-def get_l3_cache_size_mb() -> (int or None):
+def read_current_mhz() -> (float or None):
+    # One sysfs file (cpu0, in kHz) instead of psutil.cpu_freq() walking every
+    # core's cpufreq directory; other platforms get psutil's single system value.
     try:
-        system = platform.system()
-        if system == "Windows" and wmi:
+        with open(_CUR_FREQ_PATH, "r") as f:
+            return int(f.read()) / 1000.0
+    except Exception:
+        pass
+    try:
+        f = psutil.cpu_freq()
+        return f.current if f and f.current else None
+    except Exception:
+        return None
+
+SAMPLE_MAX_AGE_SECONDS = 2.0
+BASELINE_MAX_AGE_SECONDS = 60.0
+
+def _busy_and_total(t):
+    # Same accounting as psutil.cpu_percent: guest time is already counted in user/nice.
+    total = sum(t) - getattr(t, "guest", 0.0) - getattr(t, "guest_nice", 0.0)
+    idle = t.idle + getattr(t, "iowait", 0.0)
+    return total - idle, total
+
+def _percent(prev, cur):
+    busy_prev, total_prev = _busy_and_total(prev)
+    busy_cur, total_cur = _busy_and_total(cur)
+    total_delta = total_cur - total_prev
+    if total_delta <= 0:
+        return 0.0
+    return min(100.0, max(0.0, (busy_cur - busy_prev) / total_delta * 100.0))
+
+def gather_dynamic_stats(last_times=None, sample_interval=0.5):
+    # Everything that changes between refreshes: usage from one per-CPU cpu_times
+    # snapshot (a single /proc/stat read on Linux, one NtQuerySystemInformation
+    # call on Windows) plus the clock from read_current_mhz(), which /proc/stat
+    # doesn't carry. Usage is the delta against the previous snapshot, so only
+    # the very first call (no snapshot yet) has to wait for a sample window.
+    if last_times is None:
+        last_times = psutil.cpu_times(percpu=True)
+        time.sleep(sample_interval)
+    times = psutil.cpu_times(percpu=True)
+    per_core = [_percent(p, c) for p, c in zip(last_times, times)]
+    return {
+        "per_core": per_core,
+        "overall": sum(per_core) / len(per_core) if per_core else 0.0,
+        "current_mhz": read_current_mhz(),
+        "times": times,
+    }
+
+def _parse_cache_size_kb(text: str) -> (int or None):
+    # Accepts "32768K" (sysfs) as well as "32 MiB" / "512 KiB" style sizes.
+    val = text.strip().upper().replace(" ", "")
+    for suffix, factor in (("KIB", 1), ("K", 1), ("MIB", 1024), ("M", 1024)):
+        if val.endswith(suffix):
             try:
-                c = wmi.WMI()
-                for cpu in c.Win32_Processor():
-                    size_kb = getattr(cpu, "L3CacheSize", None)
-                    if size_kb:
-                        try:
-                            return int(size_kb) // 1024
-                        except Exception:
-                            return None
-            except Exception:
-                pass
-        elif system == "Linux":
+                return int(float(val[:-len(suffix)]) * factor)
+            except ValueError:
+                return None
+    return None
+
+_RELATION_CACHE = 2
+_ERROR_INSUFFICIENT_BUFFER = 122
+
+def _get_l3_cache_size_mb_win32() -> (int or None):
+    # GetLogicalProcessorInformationEx(RelationCache) returns one CACHE_RELATIONSHIP
+    # per cache instance; summing the level-3 ones gives the system total without
+    # a WMI round-trip.
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    length = ctypes.c_ulong(0)
+    kernel32.GetLogicalProcessorInformationEx(_RELATION_CACHE, None, ctypes.byref(length))
+    if ctypes.get_last_error() != _ERROR_INSUFFICIENT_BUFFER:
+        return None
+    buf = ctypes.create_string_buffer(length.value)
+    if not kernel32.GetLogicalProcessorInformationEx(_RELATION_CACHE, buf, ctypes.byref(length)):
+        return None
+    total = 0
+    offset = 0
+    while offset < length.value:
+        relationship, size = struct.unpack_from("<II", buf, offset)
+        if relationship == _RELATION_CACHE:
+            level, _associativity, _line_size, cache_size = struct.unpack_from("<BBHI", buf, offset + 8)
+            if level == 3:
+                total += cache_size
+        if size == 0:
+            break
+        offset += size
+    return total // (1024 * 1024) if total else None
+
+def _read_l3_cache_size_mb() -> (int or None):
+    # Raises when the lookup itself failed. None means the platform ran its check
+    # and found no L3 (L2-only SoCs, or no way to report one), which is final.
+    system = platform.system()
+    if system == "Windows":
+        try:
+            size_mb = _get_l3_cache_size_mb_win32()
+            if size_mb:
+                return size_mb
+        except Exception:
+            pass
+        import wmi  # optional, and slow to import (COM machinery)
+        c = wmi.WMI()
+        # L3CacheSize is per package; add them up like the other paths do.
+        total_kb = 0
+        for cpu in c.Win32_Processor(["L3CacheSize"]):
             try:
-                out = subprocess.check_output(["lscpu"], universal_newlines=True)
-                for line in out.splitlines():
-                    if "L3 cache" in line:
-                        parts = line.split(":", 1)
-                        if len(parts) > 1:
-                            val = parts[1].strip()
-                            if val.endswith("K"):
-                                return int(val[:-1]) // 1024
-                            if val.endswith("M"):
-                                return int(val[:-1])
+                total_kb += int(getattr(cpu, "L3CacheSize", None) or 0)
             except Exception:
-                pass
+                continue
+        return total_kb // 1024 if total_kb else None
+    if system == "Linux":
+        # Each L3 instance shows up under every CPU sharing it; count it once
+        # per shared_cpu_list so the result is the system total, as on Windows.
+        root = "/sys/devices/system/cpu"
+        seen = set()
+        total_kb = 0
+        for cpu in os.listdir(root):
+            if not re.fullmatch(r"cpu\d+", cpu):
+                continue
+            p = os.path.join(root, cpu, "cache")
+            if not os.path.isdir(p):
+                continue
+            for d in os.listdir(p):
+                if not d.startswith("index"):
+                    continue
+                try:
+                    with open(os.path.join(p, d, "level"), "r") as f:
+                        if f.read().strip() != "3":
+                            continue
+                    with open(os.path.join(p, d, "shared_cpu_list"), "r") as f:
+                        shared = f.read().strip()
+                    if shared in seen:
+                        continue
+                    with open(os.path.join(p, d, "size"), "r") as f:
+                        size_kb = _parse_cache_size_kb(f.read())
+                    if size_kb:
+                        seen.add(shared)
+                        total_kb += size_kb
+                except Exception:
+                    continue
+        return total_kb // 1024 if total_kb else None
+    return None
+
+def get_l3_cache_size_mb() -> (int or None):
+    try:
+        return _read_l3_cache_size_mb()
+    except Exception:
+        return None
+
+# ---------- Static info cache ----------
+
+CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "cpu_info_app", "static.json")
+CACHE_VERSION = 3  # bump whenever a cached getter changes what it returns
+
+def _cpu_identifier() -> str:
+    # Something CPU-specific that costs no subprocess (platform.processor() runs
+    # `uname -p`): Windows has it in the environment, Linux in /proc/cpuinfo.
+    ident = os.environ.get("PROCESSOR_IDENTIFIER")
+    if ident:
+        return ident
+    try:
+        with open("/proc/cpuinfo", "r") as f:
+            for line in f:
+                if line.startswith(("model name", "CPU part")):
+                    return line.split(":", 1)[1].strip()
     except Exception:
         pass
-    return None
+    return ""
 
-def get_cpu_multithread_rating():
-    cpu_name = cpuinfo.get_cpu_info().get('brand_raw', 'CPU name not available')
-    encoded_cpu_name = urllib.parse.quote(cpu_name)
-    base_url = "https://www.cpubenchmark.net/cpu.php?cpu="
-    url = f"{base_url}{encoded_cpu_name}"
+def _machine_fingerprint() -> str:
+    return f"{platform.node()}|{platform.machine()}|{os.cpu_count()}|{_cpu_identifier()}"
 
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
-                      '(KHTML, like Gecko) Chrome/117.0.0.0 Safari/537.36'
+@functools.lru_cache(maxsize=None)
+def load_static_info():
+    # CPU name, core counts, L3 size and frequency limits don't change between
+    # launches, so they are computed once per machine and reused from disk afterwards.
+    key = _machine_fingerprint()
+    try:
+        with open(CACHE_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") == CACHE_VERSION and data.get("fingerprint") == key:
+            return data
+    except Exception:
+        pass
+
+    raw_name = get_cpu_info().get("brand_raw")
+    cores = get_core_numbers()
+    try:
+        l3_cache_mb, l3_ok = _read_l3_cache_size_mb(), True
+    except Exception:
+        l3_cache_mb, l3_ok = None, False
+    data = {
+        "version": CACHE_VERSION,
+        "fingerprint": key,
+        "raw_name": raw_name or "Unknown CPU",
+        "cores": cores,
+        "l3_cache_mb": l3_cache_mb,
+        "freq": get_cpu_freq(),
     }
+    # A lookup that failed this time may succeed next launch; don't persist it.
+    # A definitive "no L3" (l3_cache_mb None, l3_ok True) is stored like any value.
+    if raw_name is None or not l3_ok or None in cores.values():
+        return data
+    try:
+        os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+        tmp = f"{CACHE_PATH}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, CACHE_PATH)
+    except Exception:
+        pass
+    return data
+
+@functools.lru_cache(maxsize=None)
+def _http_session():
+    # requests (and urllib3 behind it) is only imported once a rating is asked for.
+    import requests
+    session = requests.Session()
+    session.headers['User-Agent'] = ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+                                     '(KHTML, like Gecko) Chrome/117.0.0.0 Safari/537.36')
+    return session
+
+# The value is the text of the first element after the "Multithread Rating" text
+# node; at most a few tags may sit in between, so a non-numeric rating ("N/A")
+# can't pull in some unrelated number further down the page.
+_RATING_RE = re.compile(rb'>\s*Multithread Rating\s*(?:<[^>]+>\s*){1,5}([\d,]+)\s*<')
+
+_rating_cache = {}  # raw CPU name -> rating; only successful lookups are kept
+
+def get_cpu_multithread_rating(raw_name: str):
+    cached = _rating_cache.get(raw_name)
+    if cached is not None:
+        return cached
+    encoded_cpu_name = urllib.parse.quote(raw_name)
+    base_url = "https://www.cpubenchmark.net/cpu.php?cpu="
+    url = f"{base_url}{encoded_cpu_name}"
 
-    response = requests.get(url, headers=headers)
+    response = _http_session().get(url, timeout=3)
     if response.status_code == 200:
-        soup = BeautifulSoup(response.text, 'html.parser')
-        rating_element = soup.find(string="Multithread Rating")
-        if rating_element:
-            rating_value = rating_element.find_next().text.strip()
-            return rating_value
+        m = _RATING_RE.search(response.content)
+        if m:
+            rating = m.group(1).decode()
+            _rating_cache[raw_name] = rating
+            return rating
         else:
             return "Rating not found"
     else:
@@ -105,6 +301,18 @@ def get_cpu_multithread_rating():
 
 # ---------- Enhanced UI Class with working core updates ----------
 
+AUTO_REFRESH_SECONDS = 5.0
+UI_CHANGE_THRESHOLD = 0.5  # percent; smaller per-core changes are not redrawn
+format_percent = "%.1f %%".__mod__
+
+CORE_ROW_HEIGHT = 28
+CORE_LABEL_WIDTH = 90
+CORE_BAR_LENGTH = 500
+SPARKLINE_OFFSET = 90
+SPARKLINE_WIDTH = 120
+HISTORY_LENGTH = 120  # samples kept per core for the sparkline
+HISTORY_EMA_ALPHA = 0.2
+
 class CPUInfoApp:
     def __init__(self, root):
         self.root = root
@@ -119,12 +327,13 @@ class CPUInfoApp:
         self.small_font = font.Font(family="Helvetica", size=10)
 
         # CPU info
-        self.cpu_info = cpuinfo.get_cpu_info()
-        self.raw_name = self.cpu_info.get("brand_raw", "Unknown CPU")
+        static = load_static_info()
+        self.raw_name = static["raw_name"]
         self.brand = get_cpu_brand_name(self.raw_name)
-        self.cores = get_core_numbers()
-        self.l3_cache_mb = get_l3_cache_size_mb()
-        self.freq = get_cpu_freq()
+        self.cores = static["cores"]
+        self.l3_cache_mb = static["l3_cache_mb"]
+        self.freq = static["freq"]
+        self._current_mhz = read_current_mhz()  # live; refreshed with every sample
 
         # UI variables
         self.overall_var = StringVar(value="-- %")
@@ -153,9 +362,21 @@ class CPUInfoApp:
 
         # Auto refresh control
         self._auto_refresh = False
-
-        # First refresh
-        psutil.cpu_percent(percpu=True)  # discard initial reading
+        self._auto_thread = None
+        self._stop = threading.Event()
+
+        # First refresh (no cpu_times snapshot yet, so it samples one window)
+        self._last_times = None
+        self._last_times_ts = 0.0
+        self._last_sample = None  # (monotonic timestamp, per_core, overall, current_mhz) last displayed
+        self._pending = None  # newest sample waiting for _apply_update
+        self._pending_lock = threading.Lock()
+
+        # One long-lived worker owns _last_times; every sample, including the
+        # report's, goes through this queue. Refreshes coalesce via _refresh_queued.
+        self._q = queue.Queue()
+        self._refresh_queued = threading.Event()
+        threading.Thread(target=self._worker_loop, daemon=True).start()
         self.refresh_stats()
 
     def _build_menu(self):
@@ -203,17 +424,61 @@ class CPUInfoApp:
         ttk.Label(header, text="Core", width=10, style="Header.TLabel").grid(row=0, column=0, sticky=W)
         ttk.Label(header, text="Usage", style="Header.TLabel").grid(row=0, column=1, sticky=W)
 
+        # One Canvas for all cores: a refresh moves N rectangles instead of
+        # reconfiguring N progressbars and N labels.
+        n = self.cores['logical_cores']
+        self.core_chart = Canvas(self.core_canvas, height=n * CORE_ROW_HEIGHT, bg="#2C3E50", highlightthickness=0)
+        self.core_chart.pack(fill="x")
+        x0 = CORE_LABEL_WIDTH
         self.core_rows = []
-        for i in range(self.cores['logical_cores']):
+        self.core_sparks = []
+        for i in range(n):
             row_bg = "#34495E" if i % 2 == 0 else "#3E556E"
-            row = Frame(self.core_canvas, bg=row_bg)
-            row.pack(fill="x", pady=2)
-            Label(row, text=f"Core {i}", width=10, bg=row_bg, fg="white").grid(row=0, column=0, sticky=W, padx=5)
-            p = ttk.Progressbar(row, orient="horizontal", length=500, mode="determinate")
-            p.grid(row=0, column=1, sticky=W, padx=5)
-            lbl_val = Label(row, text="-- %", width=8, bg=row_bg, fg="white")
-            lbl_val.grid(row=0, column=2, sticky=W, padx=(6,0))
-            self.core_rows.append((p, lbl_val))
+            y0, y1 = i * CORE_ROW_HEIGHT, (i + 1) * CORE_ROW_HEIGHT - 2
+            ym = (y0 + y1) // 2
+            self.core_chart.create_rectangle(0, y0, x0 + CORE_BAR_LENGTH + SPARKLINE_OFFSET + SPARKLINE_WIDTH + 10, y1, fill=row_bg, outline="")
+            self.core_chart.create_text(10, ym, text=f"Core {i}", anchor="w", fill="white")
+            by0, by1 = y0 + 5, y1 - 5
+            self.core_chart.create_rectangle(x0, by0, x0 + CORE_BAR_LENGTH, by1, fill="#2C3E50", outline="")
+            bar = self.core_chart.create_rectangle(x0, by0, x0, by1, fill="#1ABC9C", outline="")
+            lbl = self.core_chart.create_text(x0 + CORE_BAR_LENGTH + 12, ym, text="-- %", anchor="w", fill="white")
+            self.core_rows.append((bar, lbl, by0, by1))
+            sx = x0 + CORE_BAR_LENGTH + SPARKLINE_OFFSET
+            spark = self.core_chart.create_line(sx, by1, sx + SPARKLINE_WIDTH, by1, fill="#ECF0F1")
+            self.core_sparks.append((spark, by0, by1))
+
+        # Smoothed usage history, one contiguous float32 row of HISTORY_LENGTH
+        # samples per core used as a ring buffer (_hist_idx is the oldest slot).
+        self._hist = array('f', bytes(4 * n * HISTORY_LENGTH))
+        self._hist_idx = 0
+        self._ema = [0.0] * n
+        self._last_vals = [-1.0] * n  # last value drawn per core
+        self._apply_cores = self._compile_core_updater()
+
+    def _compile_core_updater(self):
+        # The core count and every canvas item id are fixed once the table is built,
+        # so generate straight-line update code for exactly these rows: no loop,
+        # tuple unpacking or attribute lookups per core on each refresh.
+        x0 = CORE_LABEL_WIDTH
+        k = CORE_BAR_LENGTH / 100.0
+        src = [
+            "def _apply_cores(self, v):",
+            "    coords = self.core_chart.coords",
+            "    itemconfigure = self.core_chart.itemconfigure",
+            "    last = self._last_vals",
+            "    fmt = format_percent",
+        ]
+        for i, (bar, lbl, y0, y1) in enumerate(self.core_rows):
+            src += [
+                f"    x = v[{i}]",
+                f"    if abs(x - last[{i}]) >= {UI_CHANGE_THRESHOLD!r}:",
+                f"        last[{i}] = x",
+                f"        coords({bar}, {x0}, {y0}, {x0} + {k!r} * x, {y1})",
+                f"        itemconfigure({lbl}, text=fmt(x))",
+            ]
+        ns = {"format_percent": format_percent}
+        exec(compile("\n".join(src) + "\n", "<core-updater>", "exec"), ns)
+        return types.MethodType(ns["_apply_cores"], self)
 
     def _build_footer(self):
         frame = ttk.Frame(self.root, padding=15)
@@ -224,76 +489,188 @@ class CPUInfoApp:
         Button(frame, text="Quit", command=self.root.quit, bg="#E74C3C", fg="white", width=8).pack(side="right", padx=(5,0))
 
     def _format_freq(self):
-        if not self.freq or not self.freq.get('current_mhz'):
+        mhz = self._current_mhz
+        if not mhz:
             return "Frequency: Unknown"
-        return f"Frequency: {self.freq['current_mhz']} MHz ({self.freq['current_ghz']} GHz)"
+        return f"Frequency: {mhz:.2f} MHz ({mhz / 1000.0:.3f} GHz)"
 
     def refresh_stats(self):
         self.info_label.config(text="Updating CPU information...", fg="orange")
-        threading.Thread(target=self._sample_and_update, daemon=True).start()
+        if self._refresh_queued.is_set():
+            return  # a sample is already queued; this request coalesces into it
+        self._refresh_queued.set()
+        self._q.put(self._sample_and_update)
+
+    def _worker_loop(self):
+        while True:
+            task = self._q.get()
+            try:
+                task()
+            except Exception:
+                traceback.print_exc()
+
+    def _sample_percentages(self):
+        # After a long idle stretch the old snapshot would average over minutes;
+        # drop it so this sample measures a fresh window instead.
+        if time.monotonic() - self._last_times_ts > BASELINE_MAX_AGE_SECONDS:
+            self._last_times = None
+        stats = gather_dynamic_stats(self._last_times)
+        self._last_times = stats["times"]
+        self._last_times_ts = time.monotonic()
+        return stats["per_core"], stats["overall"], stats["current_mhz"]
+
+    def _get_percentages_cached(self):
+        # Reuse the sample on screen if it is recent enough instead of reading psutil again.
+        last = self._last_sample
+        if last is not None and time.monotonic() - last[0] < SAMPLE_MAX_AGE_SECONDS:
+            return last[1], last[2], last[3]
+        return self._sample_percentages()
 
     def _sample_and_update(self):
-        # discard first reading
-        psutil.cpu_percent(percpu=True)
-        per_core, overall = get_cpu_percentages(sample_interval=0.5)
-        self.root.after(0, lambda: self._update_ui(per_core, overall))
-
-    def _update_ui(self, per_core, overall):
-        self.overall_var.set(f"{overall:.1f} %")
+        self._refresh_queued.clear()
+        per_core, overall, current_mhz = self._get_percentages_cached()
+        self._post_update(per_core, overall, current_mhz)
+
+    def _post_update(self, per_core, overall, current_mhz=None):
+        # Newest sample wins: at most one UI update is queued in Tk at a time,
+        # however many samples arrive before it runs.
+        with self._pending_lock:
+            scheduled = self._pending is not None
+            self._pending = (per_core, overall, current_mhz)
+        if not scheduled:
+            self.root.after_idle(self._apply_update)
+
+    def _apply_update(self):
+        with self._pending_lock:
+            pending, self._pending = self._pending, None
+        if pending is not None:
+            self._update_ui(*pending)
+
+    def _update_ui(self, per_core, overall, current_mhz=None):
+        # A cached sample handed back by _get_percentages_cached() is not new history,
+        # and it keeps its original timestamp so it still expires on schedule.
+        fresh = self._last_sample is None or per_core is not self._last_sample[1]
+        if fresh:
+            self._last_sample = (time.monotonic(), per_core, overall, current_mhz)
+        self.overall_var.set(format_percent(overall))
+        if current_mhz:
+            self._current_mhz = current_mhz
+            self.freq_var.set(self._format_freq())
         self.overall_progress['value'] = overall
-        for i, (bar, lbl) in enumerate(self.core_rows):
-            val = per_core[i] if i < len(per_core) else 0
-            bar['value'] = val
-            lbl.config(text=f"{val:.1f} %")
+        missing = len(self.core_rows) - len(per_core)
+        self._apply_cores(list(per_core) + [0.0] * missing if missing > 0 else per_core)
+        if fresh:
+            self._push_history(per_core)
+            self._draw_sparklines()
         self.info_label.config(text="CPU information updated!", fg="green")
 
+    def _push_history(self, per_core):
+        hist, idx, ema = self._hist, self._hist_idx, self._ema
+        a = HISTORY_EMA_ALPHA
+        for i in range(len(ema)):
+            val = per_core[i] if i < len(per_core) else 0.0
+            ema[i] = (1.0 - a) * ema[i] + a * val
+            hist[i * HISTORY_LENGTH + idx] = ema[i]
+        self._hist_idx = (idx + 1) % HISTORY_LENGTH
+
+    def _draw_sparklines(self):
+        chart = self.core_chart
+        hist, idx = self._hist, self._hist_idx
+        step = SPARKLINE_WIDTH / (HISTORY_LENGTH - 1)
+        sx = CORE_LABEL_WIDTH + CORE_BAR_LENGTH + SPARKLINE_OFFSET
+        for i, (spark, y0, y1) in enumerate(self.core_sparks):
+            base = i * HISTORY_LENGTH
+            row = hist[base + idx:base + HISTORY_LENGTH] + hist[base:base + idx]
+            scale = (y1 - y0) / 100.0
+            points = []
+            for j, v in enumerate(row):
+                points.append(sx + j * step)
+                points.append(y1 - v * scale)
+            chart.coords(spark, points)
+
     def toggle_auto_refresh(self):
         self._auto_refresh = not self._auto_refresh
         if self._auto_refresh:
-            threading.Thread(target=self._auto_loop, daemon=True).start()
+            self._stop.clear()
+            self._auto_thread = threading.Thread(target=self._auto_loop, daemon=True)
+            self._auto_thread.start()
             self.info_label.config(text="Auto-refresh enabled.", fg="blue")
         else:
+            self._auto_thread = None
+            self._stop.set()
             self.info_label.config(text="Auto-refresh stopped.", fg="red")
 
     def _auto_loop(self):
-        while self._auto_refresh:
+        # Sleeps until the next tick on the monotonic clock (no drift) and wakes
+        # immediately when toggle_auto_refresh() sets _stop. The identity check
+        # retires this loop if auto-refresh was toggled off and on again meanwhile.
+        me = threading.current_thread()
+        next_tick = time.monotonic()
+        while self._auto_thread is me:
             self.refresh_stats()
-            for _ in range(50):
-                if not self._auto_refresh:
-                    break
-                threading.Event().wait(0.1)
+            next_tick += AUTO_REFRESH_SECONDS
+            if self._stop.wait(max(0.0, next_tick - time.monotonic())):
+                break
 
     def save_report(self):
-        per_core, overall = get_cpu_percentages(0.1)
-        lines = [
-            f"CPU: {self.raw_name}",
-            f"Brand: {self.brand}",
-            f"Cores: {self.cores['physical_cores']} physical / {self.cores['logical_cores']} logical",
-            self._format_freq(),
-            f"L3 Cache: {self.l3_cache_mb if self.l3_cache_mb else 'Unknown'} MB",
-            "",
-            f"Overall CPU Usage: {overall:.1f} %",
-            "Per-core usage:"
-        ]
-        for i, val in enumerate(per_core):
-            lines.append(f"  Core {i}: {val:.1f} %")
-
+        # Only the dialog needs the Tk thread. Sampling, which may take a fresh
+        # window after a stale baseline, and the write both run on the worker.
         path = filedialog.asksaveasfilename(defaultextension=".txt", initialfile="cpu_report.txt",
                                             filetypes=[("Text files", "*.txt"), ("All files", "*.*")])
         if not path:
             return
+        self._q.put(lambda: self._write_report(path))
+
+    def _build_report(self, per_core, overall):
+        buf = io.StringIO()
+        buf.write(f"CPU: {self.raw_name}\n")
+        buf.write(f"Brand: {self.brand}\n")
+        buf.write(f"Cores: {self.cores['physical_cores']} physical / {self.cores['logical_cores']} logical\n")
+        buf.write(f"{self._format_freq()}\n")
+        if self.freq.get("min_mhz") and self.freq.get("max_mhz"):
+            buf.write(f"Frequency Range: {self.freq['min_mhz']:.0f} - {self.freq['max_mhz']:.0f} MHz\n")
+        buf.write(f"L3 Cache: {self.l3_cache_mb if self.l3_cache_mb else 'Unknown'} MB\n")
+        buf.write("\n")
+        buf.write(f"Overall CPU Usage: {overall:.1f} %\n")
+        buf.write("Per-core usage:\n")
+        for i, val in enumerate(per_core):
+            buf.write(f"  Core {i}: {val:.1f} %\n")
+        return buf.getvalue()
+
+    def _write_report(self, path):
+        error = None
         try:
+            per_core, overall, _ = self._get_percentages_cached()
+            report = self._build_report(per_core, overall)
             with open(path, "w", encoding="utf-8") as f:
-                f.write("\n".join(lines))
-            messagebox.showinfo("Saved", f"Report saved to: {path}")
+                f.write(report)
         except Exception as e:
-            messagebox.showerror("Error", f"Could not save report: {e}")
+            error = e
+        self.root.after(0, lambda: self._on_report_saved(path, error))
+
+    def _on_report_saved(self, path, error):
+        if error is None:
+            messagebox.showinfo("Saved", f"Report saved to: {path}")
+        else:
+            messagebox.showerror("Error", f"Could not save report: {error}")
 
     def _show_about(self):
-        messagebox.showinfo("About", "CPU Information App\nShows CPU stats with modern GUI.\nBuilt with psutil, py-cpuinfo, requests, bs4, and tkinter.")
+        messagebox.showinfo("About", "CPU Information App\nShows CPU stats with modern GUI.\nBuilt with psutil, py-cpuinfo, requests, and tkinter.")
 
     def _show_cpu_rating(self):
-        rating = get_cpu_multithread_rating()
+        # The scrape can take seconds; keep it off the Tk thread.
+        self.info_label.config(text="Fetching CPU benchmark rating...", fg="orange")
+        threading.Thread(target=self._fetch_cpu_rating, daemon=True).start()
+
+    def _fetch_cpu_rating(self):
+        try:
+            rating = get_cpu_multithread_rating(self.raw_name)
+        except Exception as e:
+            rating = f"Request failed ({e})"
+        self.root.after(0, lambda r=rating: self._on_cpu_rating(r))
+
+    def _on_cpu_rating(self, rating):
+        self.info_label.config(text="CPU benchmark rating retrieved.", fg="green")
         messagebox.showinfo("CPU Multi-thread Rating", f"{self.raw_name}\nRating: {rating}")
 
 # ---------- Main ----------